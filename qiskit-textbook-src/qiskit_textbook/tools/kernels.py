@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+import numba
+
+
+@numba.njit(cache=True, fastmath=True)
+def apply_1q(state, U, target, n):
+    """Applies the 2x2 unitary U to qubit 'target' of the n-qubit statevector 'state' (in place)
+
+        Args:
+            state (ndarray): The statevector, of length 2**n. This array is modified.
+            U (ndarray): 2x2 matrix of the gate, with the same dtype as state.
+            target (int): Index of the qubit the gate acts on.
+            n (int): Number of qubits in the statevector.
+    """
+    stride = 1 << target
+    for i in range(1 << (n-1)):
+        # Insert a 0 at bit 'target' of i to get the index with the target qubit in |0>
+        b = ((i >> target) << (target+1)) | (i & (stride-1))
+        a0, a1 = state[b], state[b | stride]
+        state[b] = U[0, 0]*a0 + U[0, 1]*a1
+        state[b | stride] = U[1, 0]*a0 + U[1, 1]*a1
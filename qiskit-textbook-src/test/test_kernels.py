@@ -0,0 +1,27 @@
+import numpy as np
+import pytest
+from qiskit.quantum_info import Operator, random_statevector, random_unitary
+
+pytest.importorskip('numba')
+from qiskit_textbook.tools.kernels import apply_1q
+
+
+@pytest.mark.parametrize('n, target', [(1, 0), (2, 0), (2, 1), (3, 1), (4, 0), (4, 3)])
+def test_apply_1q_matches_kron(n, target):
+    U = random_unitary(2, seed=n*10 + target).data
+    state = random_statevector(2**n, seed=target).data
+    # Qiskit orders qubits little-endian, so qubit 'target' is the target-th factor from the right
+    expected = np.kron(np.kron(np.eye(2**(n-1-target)), U), np.eye(2**target)) @ state
+    out = state.copy()
+    apply_1q(out, U, target, n)
+    assert np.allclose(out, expected)
+
+
+@pytest.mark.parametrize('n, target', [(2, 1), (3, 0), (3, 2)])
+def test_apply_1q_matches_statevector_evolve(n, target):
+    U = random_unitary(2, seed=target).data
+    state = random_statevector(2**n, seed=n)
+    expected = state.evolve(Operator(U), qargs=[target]).data
+    out = state.data.copy()
+    apply_1q(out, U, target, n)
+    assert np.allclose(out, expected)